@@ -14,28 +14,47 @@ Features:
 - I/O latency monitoring
 
 Usage:
-    sudo python3 trace_syscalls.py [--pid PID] [--syscall SYSCALL]
+    sudo python3 trace_syscalls.py [--pid PID[,PID...]] [--syscall NAME[,NAME...]]
+                                   [--latency] [--verbose [--comm]]
+
+By default only per-syscall counts are collected, entirely in the kernel,
+and printed on exit. --latency adds per-syscall log2 latency histograms,
+also kept in the kernel. Pass --verbose to also stream every syscall event.
 
 Requirements:
-    - Linux kernel 4.4+
+    - Linux kernel 4.4+ (5.8+ for the BPF ring buffer; older kernels fall
+      back to the per-CPU perf buffer)
     - BCC (BPF Compiler Collection)
+    - NumPy
     - Root privileges
 
 Installation:
-    apt-get install bpfcc-tools python3-bpfcc
+    apt-get install bpfcc-tools python3-bpfcc python3-numpy
 """
 
 from bcc import BPF
+from bcc.libbcc import lib
+from collections import OrderedDict
 import argparse
+import ctypes as ct
+import glob
+import numpy as np
+import os
+import queue
 import signal
 import sys
+import threading
 import time
-from datetime import datetime
 
-# BPF program for syscall tracing
+# BPF program for syscall tracing.
+#
+# BCC compiles this with clang on every start, and most of that time goes
+# into parsing kernel headers, so only what the probes need is included.
+# The text itself is invariant (filters live in maps, modes are -D flags).
+# Loading a cached object instead is not possible through BCC, which has
+# no way to load a prebuilt ELF and relocate its map references.
 BPF_PROGRAM = """
 #include <uapi/linux/ptrace.h>
-#include <linux/sched.h>
 
 // Data structure for syscall events
 struct syscall_event_t {
@@ -44,78 +63,203 @@ struct syscall_event_t {
     u64 timestamp;
     u64 syscall_nr;
     u64 args[6];
+    u32 cpu;
+#ifdef CAPTURE_COMM
     char comm[16];
+#endif
 };
 
-// Ring buffer for event data
+// Event output: a single shared ring buffer on 5.8+, per-CPU perf
+// buffers otherwise (selected by -DUSE_RINGBUF at compile time). Only
+// built when per-event output is requested (-DEMIT_EVENTS).
+#ifdef EMIT_EVENTS
+#ifdef USE_RINGBUF
+BPF_RINGBUF_OUTPUT(events, 64);
+
+// Events dropped because the ring buffer was full (per CPU)
+BPF_PERCPU_ARRAY(ringbuf_drops, u64, 1);
+#else
 BPF_PERF_OUTPUT(events);
+#endif
+#endif
 
+#ifdef TRACK_LATENCY
+#ifdef USE_TASK_STORAGE
+// Task-local syscall entry time: a direct slot on the task, no hashing
+BPF_TASK_STORAGE(start_ts_map, u64);
+#else
 // Hash map to track syscall entry time
 BPF_HASH(start_times, u64, u64);
+#endif
+
+// Log2 latency histogram per syscall: one entry per syscall and slot
+typedef struct syscall_key {
+    u64 syscall_nr;
+    u64 slot;
+} syscall_key_t;
+BPF_HISTOGRAM(dist, syscall_key_t, MAX_SYSCALLS * 64);
+#endif
+
+// Per-CPU syscall counters indexed by syscall number
+BPF_PERCPU_ARRAY(syscall_counts, u64, MAX_SYSCALLS);
 
-// Hash map to count syscalls by type
-BPF_HASH(syscall_counts, u64, u64);
+// Runtime filters, populated from user space so the program never has to
+// be recompiled for a different filter. filter_flags[0] holds the
+// FILTER_BY_* bits of the filters that are enabled, plus TRACING_ENABLED,
+// which user space sets only once the filter maps are filled in.
+BPF_ARRAY(filter_flags, u32, 1);
+BPF_HASH(pid_filter, u32, u8);
+BPF_ARRAY(syscall_filter, u8, MAX_SYSCALLS);
 
 // Trace syscall entry
 TRACEPOINT_PROBE(raw_syscalls, sys_enter) {
     u64 pid_tgid = bpf_get_current_pid_tgid();
     u32 pid = pid_tgid >> 32;
     u32 tid = pid_tgid;
+    u64 syscall_nr = args->id;
     
-    // Filter by PID if specified
-    FILTER_PID
+    u32 zero = 0;
+    u32 *flags = filter_flags.lookup(&zero);
     
-    // Filter by syscall number if specified
-    FILTER_SYSCALL
+    // Nothing is counted or emitted until the filters are in place
+    if (!flags || !(*flags & TRACING_ENABLED)) {
+        return 0;
+    }
     
-    // Record start time
+    // Filter by PID if enabled
+    if ((*flags & FILTER_BY_PID) && pid_filter.lookup(&pid) == NULL) {
+        return 0;
+    }
+    
+    // Filter by syscall number if enabled
+    if (*flags & FILTER_BY_SYSCALL) {
+        u32 filter_key = syscall_nr;
+        u8 *wanted = syscall_filter.lookup(&filter_key);
+        if (!wanted || !*wanted) {
+            return 0;
+        }
+    }
+    
+#if defined(EMIT_EVENTS) || defined(TRACK_LATENCY)
     u64 ts = bpf_ktime_get_ns();
+#endif
+    
+#ifdef TRACK_LATENCY
+    // Record start time
+#ifdef USE_TASK_STORAGE
+    u64 *start_slot = start_ts_map.task_storage_get(
+        bpf_get_current_task_btf(), 0, BPF_LOCAL_STORAGE_GET_F_CREATE);
+    if (start_slot) {
+        *start_slot = ts;
+    }
+#else
     start_times.update(&pid_tgid, &ts);
+#endif
+#endif
     
-    // Increment syscall counter
-    u64 syscall_nr = args->id;
-    u64 *count = syscall_counts.lookup(&syscall_nr);
-    u64 new_count = count ? (*count + 1) : 1;
-    syscall_counts.update(&syscall_nr, &new_count);
-    
-    // Emit event
-    struct syscall_event_t event = {};
-    event.pid = pid;
-    event.tid = tid;
-    event.timestamp = ts;
-    event.syscall_nr = syscall_nr;
-    
-    // Copy syscall arguments
-    event.args[0] = args->args[0];
-    event.args[1] = args->args[1];
-    event.args[2] = args->args[2];
-    event.args[3] = args->args[3];
-    event.args[4] = args->args[4];
-    event.args[5] = args->args[5];
-    
-    // Get process name
-    bpf_get_current_comm(&event.comm, sizeof(event.comm));
-    
-    events.perf_submit(args, &event, sizeof(event));
+    // Increment syscall counter (per-CPU slot, no atomics needed)
+    u32 count_key = syscall_nr;
+    u64 *count = syscall_counts.lookup(&count_key);
+    if (count) {
+        (*count)++;
+    }
     
+#ifdef EMIT_EVENTS
+    // Emit event (reserved directly in the ring buffer when available)
+#ifdef USE_RINGBUF
+    struct syscall_event_t *event = events.ringbuf_reserve(sizeof(*event));
+    if (!event) {
+        u64 *drops = ringbuf_drops.lookup(&zero);
+        if (drops) {
+            (*drops)++;
+        }
+        return 0;
+    }
+#else
+    struct syscall_event_t __event = {};
+    struct syscall_event_t *event = &__event;
+#endif
+    event->pid = pid;
+    event->tid = tid;
+    event->timestamp = ts;
+    event->syscall_nr = syscall_nr;
+    event->cpu = bpf_get_smp_processor_id();
+    
+    // Copy syscall arguments in one block (straight into the ring slot)
+    __builtin_memcpy(&event->args, &args->args, sizeof(event->args));
+    
+#ifdef CAPTURE_COMM
+    // Get thread name (otherwise resolved in user space from the TID)
+    bpf_get_current_comm(&event->comm, sizeof(event->comm));
+#endif
+    
+#ifdef USE_RINGBUF
+    events.ringbuf_submit(event, 0);
+#else
+    events.perf_submit(args, event, sizeof(*event));
+#endif
+#endif
+    
+    return 0;
+}
+
+#if defined(EMIT_EVENTS) && !defined(CAPTURE_COMM)
+// Threads that exited or exec'd, so user space can drop their cached names
+BPF_HASH(expired_tids, u32, u8);
+
+static inline void expire_current(void) {
+    u32 tid = bpf_get_current_pid_tgid();
+    u8 one = 1;
+    expired_tids.update(&tid, &one);
+}
+
+TRACEPOINT_PROBE(sched, sched_process_exit) {
+    expire_current();
+    return 0;
+}
+
+TRACEPOINT_PROBE(sched, sched_process_exec) {
+    expire_current();
     return 0;
 }
+#endif
 
+#ifdef TRACK_LATENCY
 // Trace syscall exit
 TRACEPOINT_PROBE(raw_syscalls, sys_exit) {
-    u64 pid_tgid = bpf_get_current_pid_tgid();
+    u64 start = 0;
     
-    // Calculate latency
+    // Fetch and clear the entry time (0 if the entry was filtered out)
+#ifdef USE_TASK_STORAGE
+    u64 *start_ts = start_ts_map.task_storage_get(bpf_get_current_task_btf(), 0, 0);
+    if (start_ts) {
+        start = *start_ts;
+        *start_ts = 0;
+    }
+#else
+    u64 pid_tgid = bpf_get_current_pid_tgid();
     u64 *start_ts = start_times.lookup(&pid_tgid);
     if (start_ts) {
-        u64 duration = bpf_ktime_get_ns() - *start_ts;
+        start = *start_ts;
         start_times.delete(&pid_tgid);
+    }
+#endif
+    
+    // Calculate latency
+    if (start) {
+        u64 duration = bpf_ktime_get_ns() - start;
         
-        // TODO: Track latency distribution
+        // Track latency distribution
+        syscall_key_t key = {
+            .syscall_nr = args->id,
+            .slot = bpf_log2l(duration),
+        };
+        dist.increment(key);
     }
     
     return 0;
 }
+#endif
 """
 
 # Syscall names mapping (partial - common syscalls)
@@ -143,6 +287,67 @@ SYSCALL_NAMES = {
     293: "pipe2",
 }
 
+# Reverse mapping for name -> number lookups
+_NAME_TO_NR = {name: nr for nr, name in SYSCALL_NAMES.items()}
+
+# Size of the in-kernel syscall counter array (covers x86-64 syscall numbers)
+MAX_SYSCALLS = 512
+
+# Bits of filter_flags[0] in the BPF program
+FILTER_BY_PID = 1 << 0
+FILTER_BY_SYSCALL = 1 << 1
+TRACING_ENABLED = 1 << 2
+
+# First kernel release with BPF_MAP_TYPE_RINGBUF
+RINGBUF_MIN_KERNEL = (5, 8)
+
+# First kernel release with task-local storage usable from tracing programs
+# (5.11 only allows it from BPF LSM programs)
+TASK_STORAGE_MIN_KERNEL = (5, 12)
+
+# Number of TID -> thread name entries kept when names come from /proc
+COMM_CACHE_SIZE = 4096
+
+# Perf buffer fallback defaults: pages per CPU ring, and the number of
+# events the kernel accumulates before waking up the poller
+DEFAULT_PAGE_CNT = 256
+DEFAULT_WAKEUP_EVENTS = 64
+
+# Perf buffer path: raw events queued between the reader threads and the
+# formatter (events beyond this are dropped and counted as lost), and the
+# most events formatted per poll cycle before output is flushed
+PERF_QUEUE_SIZE = 65536
+FORMAT_BATCH = 4096
+
+def _kernel_version():
+    """Return the running kernel version as a (major, minor) tuple."""
+    release = os.uname().release
+    try:
+        major, minor = release.split(".")[:2]
+        return (int(major), int("".join(c for c in minor if c.isdigit()) or 0))
+    except ValueError:
+        return (0, 0)
+
+def _parse_cpulist(cpulist):
+    """Parse a sysfs CPU list such as "0-3,8-11" into a list of CPUs."""
+    cpus = []
+    for part in cpulist.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+def _numa_cpu_groups():
+    """Return the CPUs of each NUMA node (empty if not exposed by sysfs)."""
+    groups = []
+    for path in sorted(glob.glob("/sys/devices/system/node/node[0-9]*/cpulist")):
+        with open(path) as f:
+            cpus = _parse_cpulist(f.read())
+        if cpus:
+            groups.append(cpus)
+    return groups
+
 class SyscallTracer:
     """
     Main syscall tracer class.
@@ -151,86 +356,319 @@ class SyscallTracer:
     and data presentation.
     """
     
-    def __init__(self, pid=None, syscall=None):
+    def __init__(self, pids=None, syscalls=None, verbose=False, latency=False,
+                 capture_comm=False, page_cnt=DEFAULT_PAGE_CNT,
+                 wakeup_events=DEFAULT_WAKEUP_EVENTS):
         """
         Initialize the syscall tracer.
         
         Args:
-            pid: Process ID to filter (None for all processes)
-            syscall: Syscall name to filter (None for all syscalls)
+            pids: Process IDs to filter (None for all processes)
+            syscalls: Syscall names to filter (None for all syscalls)
+            verbose: Stream every event instead of only counting
+            latency: Collect per-syscall latency histograms
+            capture_comm: Copy the thread name into every event in the
+                kernel instead of resolving it from /proc by TID
+            page_cnt: Pages per CPU for the perf buffer fallback
+            wakeup_events: Events per perf buffer wakeup (fallback only)
         """
-        self.pid = pid
-        self.syscall = syscall
-        self.syscall_counts = {}
+        self.pids = pids or []
+        self.syscalls = syscalls or []
+        self.verbose = verbose
+        self.latency = latency
+        self.capture_comm = capture_comm
+        self.lost_events = 0
+        self._lost_lock = threading.Lock()
         self.start_time = time.time()
         
-        # Prepare BPF program with filters
-        bpf_text = BPF_PROGRAM
+        # Bound lookup reused for every event
+        self._syscall_name = SYSCALL_NAMES.get
         
-        # Add PID filter if specified
-        if pid:
-            bpf_text = bpf_text.replace(
-                'FILTER_PID',
-                f'if (pid != {pid}) {{ return 0; }}'
-            )
-        else:
-            bpf_text = bpf_text.replace('FILTER_PID', '')
-        
-        # Add syscall filter if specified
-        if syscall:
-            syscall_nr = self._get_syscall_number(syscall)
-            if syscall_nr is not None:
-                bpf_text = bpf_text.replace(
-                    'FILTER_SYSCALL',
-                    f'if (syscall_nr != {syscall_nr}) {{ return 0; }}'
-                )
-            else:
-                print(f"Warning: Unknown syscall '{syscall}'")
-                bpf_text = bpf_text.replace('FILTER_SYSCALL', '')
+        # Formatted events, written out once per poll cycle
+        self._out_buf = []
+        
+        # LRU of thread names read from /proc, by TID
+        self._comm_cache = OrderedDict()
+        
+        # Raw (cpu, bytes) perf events from the reader threads (perf path)
+        self._events = None
+        self._reader_threads = []
+        self._stop_readers = threading.Event()
+        
+        # "HH:MM:SS" prefix of the last formatted timestamp, by second
+        self._ts_sec = -1
+        self._ts_prefix = ""
+        
+        # Prefer the shared ring buffer; fall back to perf buffers on <5.8
+        self.use_ringbuf = _kernel_version() >= RINGBUF_MIN_KERNEL
+        cflags = [
+            f"-DMAX_SYSCALLS={MAX_SYSCALLS}",
+            f"-DFILTER_BY_PID={FILTER_BY_PID}",
+            f"-DFILTER_BY_SYSCALL={FILTER_BY_SYSCALL}",
+            f"-DTRACING_ENABLED={TRACING_ENABLED}",
+        ]
+        if verbose:
+            cflags.append("-DEMIT_EVENTS")
+        if latency:
+            cflags.append("-DTRACK_LATENCY")
+        if capture_comm:
+            cflags.append("-DCAPTURE_COMM")
+        if self.use_ringbuf:
+            cflags.append("-DUSE_RINGBUF")
+        
+        # Latency tracking keeps entry times in task-local storage where
+        # the kernel supports it, and in a pid_tgid hash map otherwise
+        self.use_task_storage = latency and _kernel_version() >= TASK_STORAGE_MIN_KERNEL
+        
+        # Initialize BPF. The program text is the same for every filter;
+        # filters are applied through maps once it is loaded.
+        if self.use_task_storage:
+            try:
+                self.bpf = BPF(text=BPF_PROGRAM, cflags=cflags + ["-DUSE_TASK_STORAGE"])
+            except Exception as e:
+                # BCC or the verifier lacks task storage for tracepoints
+                print(f"Warning: task storage unavailable, using a hash map ({e})")
+                self.use_task_storage = False
+        if not self.use_task_storage:
+            self.bpf = BPF(text=BPF_PROGRAM, cflags=cflags)
+        
+        # Offset from bpf_ktime_get_ns() (CLOCK_MONOTONIC) to local wall
+        # clock time, so event timestamps can be shown as time of day
+        self._ts_base_ns = (time.time_ns() - self.bpf.monotonic_time()
+                            + time.localtime().tm_gmtoff * 1_000_000_000)
+        
+        self._apply_filters()
+        
+        if not verbose:
+            # Count-only mode: nothing to poll, counters are read at exit
+            self._poll = lambda timeout: time.sleep(timeout / 1000.0)
+        elif self.use_ringbuf:
+            self.bpf["events"].open_ring_buffer(self._handle_event)
+            self._poll = self.bpf.ring_buffer_poll
         else:
-            bpf_text = bpf_text.replace('FILTER_SYSCALL', '')
+            # Reader threads drain the per-CPU rings and only queue the raw
+            # bytes; the main thread formats them (see _start_perf_readers)
+            self._events = queue.Queue(maxsize=PERF_QUEUE_SIZE)
+            self.bpf["events"].open_perf_buffer(
+                self._queue_event,
+                page_cnt=page_cnt,
+                wakeup_events=wakeup_events,
+                lost_cb=self._on_lost
+            )
+            self._poll = self._format_queued
+        
+        if verbose:
+            # Resolve the table and its event decoder once, not per event
+            self._Event = self.bpf["events"].event
+    
+    def _apply_filters(self):
+        """Populate the BPF filter maps from the requested PIDs/syscalls."""
+        flags = 0
+        
+        if self.pids:
+            pid_filter = self.bpf["pid_filter"]
+            for pid in self.pids:
+                pid_filter[ct.c_uint32(pid)] = ct.c_uint8(1)
+            flags |= FILTER_BY_PID
+        
+        if self.syscalls:
+            syscall_filter = self.bpf["syscall_filter"]
+            for syscall in self.syscalls:
+                syscall_nr = self._get_syscall_number(syscall)
+                if syscall_nr is None:
+                    print(f"Warning: Unknown syscall '{syscall}'")
+                    continue
+                syscall_filter[ct.c_uint32(syscall_nr)] = ct.c_uint8(1)
+                flags |= FILTER_BY_SYSCALL
         
-        # Initialize BPF
-        self.bpf = BPF(text=bpf_text)
-        self.bpf["events"].open_perf_buffer(self._handle_event)
+        # The probes are attached before the filters are set and stay inert
+        # until this bit is written, so nothing unfiltered is ever recorded
+        self.bpf["filter_flags"][ct.c_uint32(0)] = ct.c_uint32(flags | TRACING_ENABLED)
     
     def _get_syscall_number(self, syscall_name):
         """Get syscall number from name."""
-        for nr, name in SYSCALL_NAMES.items():
-            if name == syscall_name:
-                return nr
-        return None
+        return _NAME_TO_NR.get(syscall_name)
+    
+    def _on_lost(self, lost):
+        """
+        Count events dropped because a perf buffer was full.
+        
+        Ring buffer drops are counted in the kernel (ringbuf_drops) and
+        added in print_summary. Called from every reader thread.
+        """
+        with self._lost_lock:
+            self.lost_events += lost
+    
+    def _start_perf_readers(self):
+        """
+        Start one thread per NUMA node polling that node's perf rings.
+        
+        perf_reader_poll() runs without the GIL, so the nodes are drained
+        in parallel; the callbacks only copy the event onto self._events.
+        The per-CPU readers are found through BCC's perf_buffers table; if
+        none are found there, a single thread polls every ring through
+        perf_buffer_poll() instead.
+        """
+        table_id = id(self.bpf["events"])
+        try:
+            readers = {cpu: reader
+                       for (owner, cpu), reader in self.bpf.perf_buffers.items()
+                       if owner == table_id}
+        except (AttributeError, TypeError, ValueError):
+            readers = {}
+        
+        groups = [[readers.pop(cpu) for cpu in cpus if cpu in readers]
+                  for cpus in _numa_cpu_groups()]
+        groups = [group for group in groups if group]
+        if readers:
+            # CPUs missing from the NUMA topology (or no topology at all)
+            groups.append(list(readers.values()))
+        
+        targets = [(self._poll_readers, (group,)) for group in groups]
+        if not targets:
+            # BCC keeps its readers elsewhere: poll through the public API
+            targets.append((self._poll_all_readers, ()))
+        
+        for target, args in targets:
+            thread = threading.Thread(target=target, args=args, daemon=True)
+            thread.start()
+            self._reader_threads.append(thread)
+    
+    def _poll_readers(self, readers):
+        """Reader thread body: poll a group of perf rings until stopped."""
+        reader_array = (ct.c_void_p * len(readers))(*readers)
+        while not self._stop_readers.is_set():
+            lib.perf_reader_poll(len(readers), reader_array, 100)
+    
+    def _poll_all_readers(self):
+        """Reader thread body: poll every perf ring until stopped."""
+        while not self._stop_readers.is_set():
+            self.bpf.perf_buffer_poll(timeout=100)
+    
+    def _drain_perf_buffers(self):
+        """
+        Stop the reader threads and format every event still pending.
+        
+        With wakeup_events > 1 each CPU ring can hold events the kernel has
+        not signalled yet; perf_buffer_consume() reads them regardless.
+        """
+        self._stop_readers.set()
+        for thread in self._reader_threads:
+            thread.join()
+        
+        self.bpf.perf_buffer_consume()
+        while not self._events.empty():
+            self._format_queued(0)
+    
+    def _queue_event(self, cpu, data, size):
+        """
+        Perf buffer callback (reader threads): queue a copy of the event.
+        
+        If the formatter has fallen PERF_QUEUE_SIZE events behind, the
+        event is dropped and counted as lost, as the kernel would do.
+        """
+        try:
+            self._events.put_nowait((cpu, ct.string_at(data, size)))
+        except queue.Full:
+            self._on_lost(1)
+    
+    def _format_queued(self, timeout):
+        """
+        Format queued perf events on the main thread.
+        
+        Waits up to timeout ms for the first event, then handles whatever
+        else is queued, bounded so output keeps being flushed under load.
+        """
+        try:
+            cpu, raw = self._events.get(timeout=timeout / 1000.0)
+        except queue.Empty:
+            return
+        
+        handle = self._handle_event
+        get_nowait = self._events.get_nowait
+        handle(cpu, raw, len(raw))
+        for _ in range(FORMAT_BATCH - 1):
+            try:
+                cpu, raw = get_nowait()
+            except queue.Empty:
+                break
+            handle(cpu, raw, len(raw))
     
     def _handle_event(self, cpu, data, size):
         """
         Handle a syscall event from the BPF program.
         
+        Used for both the ring buffer and perf buffer paths. The CPU is
+        taken from the event itself, since the shared ring buffer does not
+        report one.
+        
         Args:
-            cpu: CPU number where event occurred
-            data: Event data from BPF
+            cpu: CPU number (perf buffer) or context (ring buffer), unused
+            data: Event data from BPF (a copy in bytes on the perf path)
             size: Size of event data
         """
         # Parse event structure
-        event = self.bpf["events"].event(data)
+        event = self._Event(data)
         
         # Get syscall name
-        syscall_name = SYSCALL_NAMES.get(event.syscall_nr, f"syscall_{event.syscall_nr}")
+        syscall_name = (self._syscall_name(event.syscall_nr)
+                        or f"syscall_{event.syscall_nr}")
         
-        # Update counts
-        if syscall_name not in self.syscall_counts:
-            self.syscall_counts[syscall_name] = 0
-        self.syscall_counts[syscall_name] += 1
-        
-        # Format timestamp
-        ts = datetime.fromtimestamp(event.timestamp / 1e9).strftime('%H:%M:%S.%f')[:-3]
+        # Format local time of day; the HH:MM:SS part only changes once a second
+        ts_ns = event.timestamp + self._ts_base_ns
+        sec = ts_ns // 1_000_000_000
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_prefix = f"{sec // 3600 % 24:02d}:{sec // 60 % 60:02d}:{sec % 60:02d}"
+        ms = ts_ns // 1_000_000 % 1000
         
         # Decode process name
-        comm = event.comm.decode('utf-8', 'replace')
+        if self.capture_comm:
+            comm = event.comm.decode('utf-8', 'replace')
+        else:
+            comm = self._lookup_comm(event.pid, event.tid)
         
-        # Print event
-        print(f"{ts} CPU{cpu:02d} {comm:16s} PID={event.pid:6d} TID={event.tid:6d} "
-              f"{syscall_name:16s} args=({event.args[0]:#x}, {event.args[1]:#x}, "
-              f"{event.args[2]:#x}, ...)")
+        # Queue event for the next write
+        args = event.args
+        self._out_buf.append(
+            f"{self._ts_prefix}.{ms:03d} CPU{event.cpu:02d} {comm:16s} "
+            f"PID={event.pid:6d} TID={event.tid:6d} {syscall_name:16s} "
+            f"args=({args[0]:#x}, {args[1]:#x}, {args[2]:#x}, ...)\n"
+        )
+    
+    def _lookup_comm(self, pid, tid):
+        """Return the name of thread tid, from the LRU cache or /proc."""
+        cache = self._comm_cache
+        comm = cache.get(tid)
+        if comm is not None:
+            cache.move_to_end(tid)
+            return comm
+        
+        try:
+            with open(f"/proc/{pid}/task/{tid}/comm") as f:
+                comm = f.read().rstrip("\n")
+        except OSError:
+            # Already exited; not cached, as the tid may be reused
+            return "?"
+        
+        cache[tid] = comm
+        if len(cache) > COMM_CACHE_SIZE:
+            cache.popitem(last=False)
+        return comm
+    
+    def _expire_comms(self):
+        """Drop cached names of threads that exited or exec'd."""
+        expired = self.bpf["expired_tids"]
+        for key in list(expired.keys()):
+            self._comm_cache.pop(key.value, None)
+            del expired[key]
+    
+    def _flush_output(self):
+        """Write all queued events to stdout in a single call."""
+        if self._out_buf:
+            sys.stdout.write("".join(self._out_buf))
+            sys.stdout.flush()
+            self._out_buf.clear()
     
     def run(self):
         """
@@ -239,17 +677,33 @@ class SyscallTracer:
         This runs until interrupted by Ctrl+C.
         """
         print("Tracing syscalls... Press Ctrl+C to stop")
-        print(f"Filter - PID: {self.pid or 'ALL'}, Syscall: {self.syscall or 'ALL'}")
+        pids = ",".join(str(pid) for pid in self.pids) or "ALL"
+        syscalls = ",".join(self.syscalls) or "ALL"
+        print(f"Filter - PID: {pids}, Syscall: {syscalls}")
+        if not self.verbose:
+            print("Counting in kernel; summary is printed on exit (use --verbose for events)")
         print("-" * 100)
         
+        if self._events is not None:
+            self._start_perf_readers()
+        
+        poll = self._poll
+        flush = self._flush_output
+        expire = self._expire_comms if self.verbose and not self.capture_comm else None
         try:
             while True:
-                self.bpf.perf_buffer_poll(timeout=100)
+                poll(timeout=100)
+                flush()
+                if expire:
+                    expire()
         except KeyboardInterrupt:
             pass
     
     def print_summary(self):
         """Print summary statistics."""
+        if self._events is not None:
+            self._drain_perf_buffers()
+        self._flush_output()
         elapsed = time.time() - self.start_time
         
         print("\n" + "=" * 80)
@@ -259,16 +713,24 @@ class SyscallTracer:
         print("\nTop Syscalls by Count:")
         print("-" * 40)
         
-        # Sort by count
-        sorted_syscalls = sorted(
-            self.syscall_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        # Sum the per-CPU counters maintained by the BPF program into one
+        # count per syscall number (rows: syscall_nr, columns: CPU)
+        per_cpu = np.array(self.bpf["syscall_counts"].values(), dtype=np.uint64)
+        counts = per_cpu.sum(axis=1)
+        
+        total_calls = int(counts.sum())
+        if not total_calls:
+            print("No syscalls recorded")
+            return
         
-        total_calls = sum(self.syscall_counts.values())
+        # Top 20 syscall numbers by count, largest first
+        top = np.argsort(counts, kind="stable")[::-1][:20]
         
-        for syscall, count in sorted_syscalls[:20]:
+        for nr in top:
+            count = int(counts[nr])
+            if not count:
+                break
+            syscall = SYSCALL_NAMES.get(int(nr), f"syscall_{nr}")
             percentage = 100.0 * count / total_calls
             calls_per_sec = count / elapsed
             print(f"{syscall:20s} {count:10d} ({percentage:5.1f}%) "
@@ -276,6 +738,47 @@ class SyscallTracer:
         
         print(f"\nTotal syscalls: {total_calls}")
         print(f"Calls per second: {total_calls / elapsed:.1f}")
+        
+        lost_events = self.lost_events
+        if self.verbose and self.use_ringbuf:
+            lost_events += sum(self.bpf["ringbuf_drops"][ct.c_int(0)])
+        if lost_events:
+            print(f"Lost events: {lost_events}")
+        
+        if self.latency:
+            print("\nSyscall Latency Distribution:")
+            print("-" * 40)
+            self.bpf["dist"].print_log2_hist(
+                "nsecs", "syscall",
+                section_print_fn=lambda nr: SYSCALL_NAMES.get(nr, f"syscall_{nr}")
+            )
+
+def _parse_list(value, item_type=str):
+    """Parse a comma-separated CLI value into a list of item_type."""
+    try:
+        return [item_type(item) for item in value.split(",") if item]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid list: '{value}'")
+
+def _power_of_two(value):
+    """argparse type for a positive power of two (perf buffer page counts)."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0 or number & (number - 1):
+        raise argparse.ArgumentTypeError(f"must be a power of two: '{value}'")
+    return number
+
+def _positive_int(value):
+    """argparse type for a positive integer (perf buffer wakeup counts)."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: '{value}'")
+    return number
 
 def main():
     """Main entry point."""
@@ -286,27 +789,72 @@ def main():
     
     parser.add_argument(
         "--pid",
-        type=int,
-        help="Process ID to trace (default: all processes)"
+        type=lambda value: _parse_list(value, int),
+        help="Comma-separated process IDs to trace (default: all processes)"
     )
     
     parser.add_argument(
         "--syscall",
-        type=str,
-        help="Syscall name to trace (default: all syscalls)"
+        type=_parse_list,
+        help="Comma-separated syscall names to trace (default: all syscalls)"
+    )
+    
+    parser.add_argument(
+        "-L", "--latency",
+        action="store_true",
+        help="Collect per-syscall latency histograms"
+    )
+    
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print every syscall event (default: counts only)"
+    )
+    
+    parser.add_argument(
+        "--comm",
+        action="store_true",
+        help="With --verbose, copy thread names in the kernel for every "
+             "event (default: resolve them from /proc by TID)"
+    )
+    
+    parser.add_argument(
+        "-P", "--page-cnt",
+        type=_power_of_two,
+        default=DEFAULT_PAGE_CNT,
+        help="Perf buffer pages per CPU, kernels <5.8 only "
+             f"(default: {DEFAULT_PAGE_CNT})"
+    )
+    
+    parser.add_argument(
+        "--wakeup-events",
+        type=_positive_int,
+        default=DEFAULT_WAKEUP_EVENTS,
+        help="Events per perf buffer wakeup, kernels <5.8 only; higher values "
+             "cut wakeups but delay output from quiet CPUs until that many "
+             f"events are pending (default: {DEFAULT_WAKEUP_EVENTS})"
     )
     
     args = parser.parse_args()
+    if args.comm and not args.verbose:
+        parser.error("--comm requires --verbose")
     
     # Check if running as root
-    import os
     if os.geteuid() != 0:
         print("Error: This script requires root privileges")
         print("Please run with: sudo python3 trace_syscalls.py")
         sys.exit(1)
     
     # Create tracer
-    tracer = SyscallTracer(pid=args.pid, syscall=args.syscall)
+    tracer = SyscallTracer(
+        pids=args.pid,
+        syscalls=args.syscall,
+        verbose=args.verbose,
+        latency=args.latency,
+        capture_comm=args.comm,
+        page_cnt=args.page_cnt,
+        wakeup_events=args.wakeup_events
+    )
     
     # Set up signal handler for clean exit
     def signal_handler(sig, frame):
@@ -14,6 +14,27 @@
 import gdb
 import struct
 
+# struct format characters for little-endian integer fields, by size
+_UINT_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+_SINT_FORMATS = {1: "b", 2: "h", 4: "i", 8: "q"}
+
+def _is_signed(int_type):
+    """Return True if a (typedef-stripped) gdb.Type is a signed integer."""
+    try:
+        return int_type.is_signed
+    except AttributeError:
+        # GDB < 12: go by the type code and the base type name
+        name = int_type.name or ""
+        return (int_type.code == gdb.TYPE_CODE_INT
+                and not name.startswith(("unsigned", "u", "_Bool", "bool")))
+    except ValueError:
+        # Not a scalar type
+        return False
+
+# Precompiled decoder for 64-bit page table entries
+_PTE = struct.Struct('<Q')
+_PTE_UNPACK = _PTE.unpack_from
+
 class NeuroTasksCommand(gdb.Command):
     """
     Display all tasks/processes in the Neuro-OS kernel.
@@ -26,11 +47,26 @@ class NeuroTasksCommand(gdb.Command):
     - Memory usage
     - Name/command
     
+    Each task is fetched with a single memory read and decoded from the
+    field offsets in the debug info, rather than one remote round-trip
+    per field.
+    
     Usage: neuro-tasks [--detailed]
     """
     
+    # Integer fields decoded from each task, in output order
+    _FIELDS = ("pid", "state", "priority", "cpu_affinity", "memory_pages",
+               "next", "page_table", "stack_ptr", "parent_pid")
+    
     def __init__(self):
         super(NeuroTasksCommand, self).__init__("neuro-tasks", gdb.COMMAND_USER)
+        self._layouts = {}
+        gdb.events.new_objfile.connect(self._clear_layouts)
+        gdb.events.clear_objfiles.connect(self._clear_layouts)
+    
+    def _clear_layouts(self, event):
+        """Forget decoded task layouts when the loaded symbol files change."""
+        self._layouts.clear()
     
     def invoke(self, arg, from_tty):
         """Execute the neuro-tasks command."""
@@ -45,32 +81,13 @@ class NeuroTasksCommand(gdb.Command):
             print("-" * 60)
             
             # Walk the linked list of tasks
-            current_task = task_list_head['next']
-            task_count = 0
+            task_type = task_list_head['next'].type.target().strip_typedefs()
+            layout = self._task_layout(task_type)
             
-            while current_task != task_list_head.address:
-                task = current_task.dereference()
-                
-                # Extract task fields
-                pid = int(task['pid'])
-                state = self._decode_task_state(int(task['state']))
-                priority = int(task['priority'])
-                cpu_affinity = int(task['cpu_affinity'])
-                memory_kb = int(task['memory_pages']) * 4  # Assuming 4KB pages
-                command = task['name'].string()
-                
-                print(f"{pid:<6} {state:<11} {priority:<5} {cpu_affinity:<4} {memory_kb:<8} {command}")
-                
-                if detailed:
-                    self._print_detailed_task_info(task)
-                
-                current_task = task['next']
-                task_count += 1
-                
-                # Prevent infinite loops in corrupted lists
-                if task_count > 10000:
-                    print("Warning: Task list may be corrupted (too many entries)")
-                    break
+            if layout is not None:
+                task_count = self._walk_tasks_batched(task_list_head, layout, detailed)
+            else:
+                task_count = self._walk_tasks(task_list_head, detailed)
             
             print(f"\nTotal tasks: {task_count}")
             
@@ -78,6 +95,131 @@ class NeuroTasksCommand(gdb.Command):
             print(f"Error accessing task list: {e}")
             print("Make sure kernel symbols are loaded and execution is paused")
     
+    def _task_layout(self, task_type):
+        """
+        Compute how to decode a task from raw memory.
+        
+        Returns a (size, format, index, name_offset, name_size) tuple, where
+        size is how many bytes to read (up to the last field used, not the
+        whole task, which may embed large buffers), format is a compiled
+        struct.Struct that unpacks the _FIELDS sorted by offset and index
+        maps them back to _FIELDS order.
+        Returns None if the type does not have the expected fields (e.g.
+        name is not an inline char array, or a field is a bitfield).
+        """
+        key = str(task_type)
+        if key in self._layouts:
+            return self._layouts[key]
+        
+        layout = None
+        try:
+            fields = {field.name: field for field in task_type.fields()}
+            
+            # Build one format with pad bytes between the wanted fields,
+            # signed or unsigned to match each field's type
+            order = sorted(self._FIELDS, key=lambda name: fields[name].bitpos)
+            fmt = "<"
+            pos = 0
+            for name in order:
+                if fields[name].bitsize:
+                    raise ValueError("bitfield")
+                field_type = fields[name].type.strip_typedefs()
+                offset = fields[name].bitpos // 8
+                if offset < pos:
+                    raise ValueError("overlapping task fields")
+                formats = _SINT_FORMATS if _is_signed(field_type) else _UINT_FORMATS
+                fmt += f"{offset - pos}x{formats[field_type.sizeof]}"
+                pos = offset + field_type.sizeof
+            
+            # Fields come out sorted by offset; remember where each one went
+            index = tuple(order.index(name) for name in self._FIELDS)
+            
+            name_type = fields['name'].type.strip_typedefs()
+            if name_type.code == gdb.TYPE_CODE_ARRAY:
+                name_offset = fields['name'].bitpos // 8
+                read_size = max(pos, name_offset + name_type.sizeof)
+                layout = (read_size, struct.Struct(fmt), index,
+                          name_offset, name_type.sizeof)
+        except (KeyError, ValueError, struct.error, gdb.error):
+            # Unexpected layout; fall back to per-field access
+            layout = None
+        
+        self._layouts[key] = layout
+        return layout
+    
+    def _walk_tasks_batched(self, task_list_head, layout, detailed):
+        """Walk the task list reading each task in one block. Returns the count."""
+        read_size, task_struct, index, name_offset, name_size = layout
+        unpack_task = task_struct.unpack_from
+        inferior = gdb.selected_inferior()
+        head_addr = int(task_list_head.address)
+        addr = int(task_list_head['next'])
+        task_count = 0
+        
+        while addr != head_addr:
+            mem = bytes(inferior.read_memory(addr, read_size))
+            raw = unpack_task(mem, 0)
+            (pid, state, priority, cpu_affinity, memory_pages,
+             next_addr, page_table, stack_ptr, parent_pid) = (raw[i] for i in index)
+            name = mem[name_offset:name_offset + name_size]
+            command = name.split(b"\0", 1)[0].decode("utf-8", "replace")
+            
+            self._print_task(pid, state, priority, cpu_affinity, memory_pages, command)
+            
+            if detailed:
+                self._print_detailed_task_info(page_table, stack_ptr, parent_pid)
+            
+            addr = next_addr
+            task_count += 1
+            
+            # Prevent infinite loops in corrupted lists
+            if task_count > 10000:
+                print("Warning: Task list may be corrupted (too many entries)")
+                break
+        
+        return task_count
+    
+    def _walk_tasks(self, task_list_head, detailed):
+        """Walk the task list field by field. Returns the count."""
+        current_task = task_list_head['next']
+        task_count = 0
+        
+        while current_task != task_list_head.address:
+            task = current_task.dereference()
+            
+            # Extract task fields
+            pid = int(task['pid'])
+            state = int(task['state'])
+            priority = int(task['priority'])
+            cpu_affinity = int(task['cpu_affinity'])
+            memory_pages = int(task['memory_pages'])
+            command = task['name'].string()
+            
+            self._print_task(pid, state, priority, cpu_affinity, memory_pages, command)
+            
+            if detailed:
+                self._print_detailed_task_info(
+                    int(task['page_table']),
+                    int(task['stack_ptr']),
+                    int(task['parent_pid'])
+                )
+            
+            current_task = task['next']
+            task_count += 1
+            
+            # Prevent infinite loops in corrupted lists
+            if task_count > 10000:
+                print("Warning: Task list may be corrupted (too many entries)")
+                break
+        
+        return task_count
+    
+    def _print_task(self, pid, state, priority, cpu_affinity, memory_pages, command):
+        """Print one row of the task table."""
+        state = self._decode_task_state(state)
+        memory_kb = memory_pages * 4  # Assuming 4KB pages
+        print(f"{pid:<6} {state:<11} {priority:<5} {cpu_affinity:<4} {memory_kb:<8} {command}")
+    
     def _decode_task_state(self, state):
         """Decode numeric task state to human-readable string."""
         states = {
@@ -90,11 +232,11 @@ class NeuroTasksCommand(gdb.Command):
         }
         return states.get(state, f"UNKNOWN({state})")
     
-    def _print_detailed_task_info(self, task):
+    def _print_detailed_task_info(self, page_table, stack_ptr, parent_pid):
         """Print detailed information about a task."""
-        print(f"    Page table: 0x{int(task['page_table']):016x}")
-        print(f"    Stack pointer: 0x{int(task['stack_ptr']):016x}")
-        print(f"    Parent PID: {int(task['parent_pid'])}")
+        print(f"    Page table: 0x{page_table:016x}")
+        print(f"    Stack pointer: 0x{stack_ptr:016x}")
+        print(f"    Parent PID: {parent_pid}")
         print()
 
 class NeuroMemoryCommand(gdb.Command):
@@ -108,11 +250,33 @@ class NeuroMemoryCommand(gdb.Command):
     - Page allocation statistics
     - Memory fragmentation info
     
+    Global symbols are looked up once and reused across invocations (until
+    new symbols are loaded); their values are re-read on every call.
+    
     Usage: neuro-memory [--regions]
     """
     
     def __init__(self):
         super(NeuroMemoryCommand, self).__init__("neuro-memory", gdb.COMMAND_USER)
+        self._symbols = {}
+        gdb.events.new_objfile.connect(self._clear_symbols)
+        gdb.events.clear_objfiles.connect(self._clear_symbols)
+    
+    def _clear_symbols(self, event):
+        """Forget cached symbols when the loaded symbol files change."""
+        self._symbols.clear()
+    
+    def _global_value(self, name):
+        """Return the current value of a kernel global or static, caching the symbol."""
+        symbol = self._symbols.get(name)
+        if symbol is None:
+            # File-scope statics are not global symbols; parse_and_eval,
+            # used before, found both
+            symbol = gdb.lookup_global_symbol(name) or gdb.lookup_static_symbol(name)
+            if symbol is None:
+                raise gdb.error(f"No symbol \"{name}\" in current context.")
+            self._symbols[name] = symbol
+        return symbol.value()
     
     def invoke(self, arg, from_tty):
         """Execute the neuro-memory command."""
@@ -120,8 +284,8 @@ class NeuroMemoryCommand(gdb.Command):
         
         try:
             # Get memory statistics from kernel globals
-            total_pages = int(gdb.parse_and_eval("total_memory_pages"))
-            free_pages = int(gdb.parse_and_eval("free_memory_pages"))
+            total_pages = int(self._global_value("total_memory_pages"))
+            free_pages = int(self._global_value("free_memory_pages"))
             
             total_mb = (total_pages * 4) // 1024
             free_mb = (free_pages * 4) // 1024
@@ -141,17 +305,24 @@ class NeuroMemoryCommand(gdb.Command):
             print("Page Allocator Statistics")
             print("=" * 40)
             
-            for order in range(11):  # Buddy allocator orders 0-10
-                try:
-                    free_list = gdb.parse_and_eval(f"free_pages[{order}]")
-                    count = int(free_list['count'])
-                    size_kb = (2 ** order) * 4
-                    
-                    if count > 0:
-                        print(f"Order {order:2d} ({size_kb:>6} KB): {count:>6} blocks")
-                except (gdb.error, ValueError, RuntimeError):
-                    # Some kernels may not expose allocator stats for all orders; skip missing/invalid entries
-                    pass
+            try:
+                free_lists = self._global_value("free_pages")
+            except gdb.error:
+                # Allocator stats are optional; print the header only
+                free_lists = None
+            
+            if free_lists is not None:
+                for order in range(11):  # Buddy allocator orders 0-10
+                    try:
+                        count = int(free_lists[order]['count'])
+                        size_kb = (2 ** order) * 4
+                        
+                        if count > 0:
+                            print(f"Order {order:2d} ({size_kb:>6} KB): {count:>6} blocks")
+                    except (gdb.error, ValueError, RuntimeError):
+                        # Some kernels may not expose allocator stats for all orders;
+                        # skip missing/invalid entries
+                        pass
             
         except gdb.error as e:
             print(f"Error accessing memory statistics: {e}")
@@ -187,17 +358,27 @@ class NeuroBacktraceCommand(gdb.Command):
     - Inlined function information
     - Register state at each frame
     
-    Usage: neuro-trace [--registers]
+    --no-lines skips the source line lookup, which is the slowest part of
+    walking deep stacks.
+    
+    Usage: neuro-trace [--registers] [--no-lines]
     """
     
+    # Common x86-64 registers shown with --registers
+    _REGISTERS = ("rax", "rbx", "rcx", "rdx", "rsi", "rdi", "rbp", "rsp", "rip")
+    
     def __init__(self):
         super(NeuroBacktraceCommand, self).__init__("neuro-trace", gdb.COMMAND_USER)
     
     def invoke(self, arg, from_tty):
         """Execute the neuro-trace command."""
         show_registers = "--registers" in arg
+        show_lines = "--no-lines" not in arg
+        selected = None
         
         try:
+            if show_registers:
+                selected = gdb.selected_frame()
             frame = gdb.newest_frame()
             frame_num = 0
             
@@ -208,14 +389,15 @@ class NeuroBacktraceCommand(gdb.Command):
                 # Get frame information
                 pc = frame.pc()
                 name = frame.name() or "??"
-                sal = frame.find_sal()
                 
                 # Format output
                 print(f"#{frame_num:<3} 0x{pc:016x} in {name}", end="")
                 
-                if sal.symtab:
-                    filename = sal.symtab.filename.split('/')[-1]
-                    print(f" at {filename}:{sal.line}", end="")
+                if show_lines:
+                    sal = frame.find_sal()
+                    if sal.symtab:
+                        filename = sal.symtab.filename.split('/')[-1]
+                        print(f" at {filename}:{sal.line}", end="")
                 
                 print()
                 
@@ -235,23 +417,53 @@ class NeuroBacktraceCommand(gdb.Command):
             
         except gdb.error as e:
             print(f"Error generating backtrace: {e}")
+        finally:
+            # Printing registers selects each frame in turn; restore the user's
+            if selected is not None and selected.is_valid():
+                selected.select()
+    
+    def _read_frame_registers(self, frame):
+        """
+        Read _REGISTERS for a frame with one "info registers" command.
+        
+        Returns a list of (name, value) pairs; registers that cannot be
+        read in this frame are left out.
+        """
+        frame.select()
+        regs_text = gdb.execute(f"info registers {' '.join(self._REGISTERS)}",
+                                to_string=True)
+        
+        values = []
+        for line in regs_text.splitlines():
+            fields = line.split()
+            if len(fields) >= 2 and fields[0] in self._REGISTERS:
+                try:
+                    values.append((fields[0], int(fields[1], 16)))
+                except ValueError:
+                    # "<unavailable>" or similar
+                    pass
+        return values
     
     def _print_frame_registers(self, frame):
         """Print register values for a frame."""
         try:
-            # Get common x86-64 registers
-            regs = ["rax", "rbx", "rcx", "rdx", "rsi", "rdi", "rbp", "rsp", "rip"]
+            try:
+                values = self._read_frame_registers(frame)
+            except gdb.error:
+                # Fall back to reading registers one at a time
+                values = []
+                for reg in self._REGISTERS:
+                    try:
+                        values.append((reg, int(frame.read_register(reg))))
+                    except gdb.error:
+                        # Ignore registers that cannot be read in the current frame
+                        pass
             
             print("    Registers:", end="")
-            for i, reg in enumerate(regs):
-                try:
-                    val = frame.read_register(reg)
-                    if i % 3 == 0:
-                        print(f"\n    ", end="")
-                    print(f"{reg}=0x{int(val):016x}  ", end="")
-                except gdb.error:
-                    # Ignore registers that cannot be read in the current frame
-                    pass
+            for i, (reg, val) in enumerate(values):
+                if i % 3 == 0:
+                    print(f"\n    ", end="")
+                print(f"{reg}=0x{val:016x}  ", end="")
             print()
         except gdb.error:
             # Best-effort register printing: ignore unexpected failures so backtrace still works
@@ -269,11 +481,41 @@ class NeuroPageTableWalk(gdb.Command):
     - Final physical address
     - Page flags (present, writable, user, etc.)
     
+    Each entry is read with the 64-byte cache line around it, so a walk
+    costs one small read per level. Lines are cached until the target
+    resumes, so later walks that share upper-level tables need no further
+    memory reads.
+    
     Usage: neuro-pagetable <virtual_address>
     """
     
-    def __init__(self):
-        super(NeuroPageTableWalk, self).__init__("neuro-pagetable", gdb.COMMAND_USER)
+    # Page table entry flag bits and their names, in display order
+    _FLAG_TABLE = (
+        (1 << 0, "P"),    # Present
+        (1 << 1, "W"),    # Writable
+        (1 << 2, "U"),    # User
+        (1 << 3, "PWT"),  # Write-through
+        (1 << 4, "PCD"),  # Cache disabled
+        (1 << 5, "A"),    # Accessed
+        (1 << 6, "D"),    # Dirty
+        (1 << 7, "PS"),   # Page size
+        (1 << 63, "NX"),  # No execute
+    )
+    
+    # 64-byte lines of page tables (by physical address) and whole 4KB
+    # tables (by physical base), shared by all page table commands
+    _lines = {}
+    _tables = {}
+    
+    def __init__(self, name="neuro-pagetable"):
+        super(NeuroPageTableWalk, self).__init__(name, gdb.COMMAND_USER)
+        gdb.events.cont.connect(self._clear_tables)
+        gdb.events.memory_changed.connect(self._clear_tables)
+    
+    def _clear_tables(self, event):
+        """Drop cached page tables once the target may have changed them."""
+        self._lines.clear()
+        self._tables.clear()
     
     def invoke(self, arg, from_tty):
         """Execute the neuro-pagetable command."""
@@ -303,7 +545,7 @@ class NeuroPageTableWalk(gdb.Command):
             offset = vaddr & 0xFFF
             
             # Walk PML4
-            pml4_entry = self._read_pte(pml4_base + pml4_idx * 8)
+            pml4_entry = self._read_entry(pml4_base, pml4_idx)
             print(f"PML4[{pml4_idx:3d}] = 0x{pml4_entry:016x} {self._decode_flags(pml4_entry)}")
             
             if not (pml4_entry & 1):
@@ -312,7 +554,7 @@ class NeuroPageTableWalk(gdb.Command):
             
             # Walk PDPT
             pdpt_base = pml4_entry & ~0xFFF
-            pdpt_entry = self._read_pte(pdpt_base + pdpt_idx * 8)
+            pdpt_entry = self._read_entry(pdpt_base, pdpt_idx)
             print(f"PDPT[{pdpt_idx:3d}] = 0x{pdpt_entry:016x} {self._decode_flags(pdpt_entry)}")
             
             if not (pdpt_entry & 1):
@@ -321,7 +563,7 @@ class NeuroPageTableWalk(gdb.Command):
             
             # Walk PD
             pd_base = pdpt_entry & ~0xFFF
-            pd_entry = self._read_pte(pd_base + pd_idx * 8)
+            pd_entry = self._read_entry(pd_base, pd_idx)
             print(f"PD[{pd_idx:3d}]   = 0x{pd_entry:016x} {self._decode_flags(pd_entry)}")
             
             if not (pd_entry & 1):
@@ -337,7 +579,7 @@ class NeuroPageTableWalk(gdb.Command):
             
             # Walk PT
             pt_base = pd_entry & ~0xFFF
-            pt_entry = self._read_pte(pt_base + pt_idx * 8)
+            pt_entry = self._read_entry(pt_base, pt_idx)
             print(f"PT[{pt_idx:3d}]   = 0x{pt_entry:016x} {self._decode_flags(pt_entry)}")
             
             if not (pt_entry & 1):
@@ -352,45 +594,165 @@ class NeuroPageTableWalk(gdb.Command):
         except Exception as e:
             print(f"Error walking page table: {e}")
     
-    def _read_pte(self, addr):
-        """Read a page table entry from memory."""
+    def _read_entry(self, base, index):
+        """Read entry index of the page table at base, a 64-byte line at a time."""
+        table = self._tables.get(base)
+        if table is not None:
+            return _PTE_UNPACK(table, index * 8)[0]
+        
+        addr = base + (index & ~7) * 8
         try:
-            inferior = gdb.selected_inferior()
-            mem = inferior.read_memory(addr, 8)
-            return struct.unpack('<Q', mem)[0]
+            line = self._lines.get(addr)
+            if line is None:
+                line = bytes(gdb.selected_inferior().read_memory(addr, 64))
+                self._lines[addr] = line
+            return _PTE_UNPACK(line, (index & 7) * 8)[0]
         except (gdb.error, RuntimeError, struct.error):
             # Return 0 if memory cannot be read (e.g., invalid address)
             return 0
     
     def _decode_flags(self, entry):
         """Decode page table entry flags."""
-        flags = []
-        if entry & (1 << 0):
-            flags.append("P")  # Present
-        if entry & (1 << 1):
-            flags.append("W")  # Writable
-        if entry & (1 << 2):
-            flags.append("U")  # User
-        if entry & (1 << 3):
-            flags.append("PWT")  # Write-through
-        if entry & (1 << 4):
-            flags.append("PCD")  # Cache disabled
-        if entry & (1 << 5):
-            flags.append("A")  # Accessed
-        if entry & (1 << 6):
-            flags.append("D")  # Dirty
-        if entry & (1 << 7):
-            flags.append("PS")  # Page size
-        if entry & (1 << 63):
-            flags.append("NX")  # No execute
+        flags = [name for bit, name in self._FLAG_TABLE if entry & bit]
         
         return f"[{' '.join(flags)}]" if flags else "[None]"
 
+class NeuroPageTableRange(NeuroPageTableWalk):
+    """
+    Dump every mapped page in a virtual address range.
+    
+    Unmapped regions are skipped a whole table entry at a time, and the
+    non-canonical hole between the user and kernel halves is skipped
+    entirely. The address translation for each page size (4KB, 2MB, 1GB)
+    is generated once with its masks inlined. Page tables are read a whole
+    4KB table at a time, as neighbouring entries are used next, and cached
+    until the target resumes; neuro-pagetable reuses the cached tables.
+    
+    Usage: neuro-pagetable-range <start> <end>
+    """
+    
+    # Physical frame bits of an entry (excludes flags and NX)
+    _PHYS_ADDR_MASK = 0x000FFFFFFFFFF000
+    
+    # Non-canonical addresses with 4-level paging: [_HOLE_START, _HIGH_HALF)
+    _HOLE_START = 0x0000800000000000
+    _HIGH_HALF = 0xFFFF800000000000
+    
+    def __init__(self):
+        super(NeuroPageTableRange, self).__init__("neuro-pagetable-range")
+        self._translators = None
+    
+    def _specialize(self):
+        """Build translate_4k/_2m/_1g with their constants inlined."""
+        if self._translators is None:
+            code = ""
+            for name, shift in (("4k", 12), ("2m", 21), ("1g", 30)):
+                offset_mask = (1 << shift) - 1
+                frame_mask = self._PHYS_ADDR_MASK & ~offset_mask
+                code += (f"def translate_{name}(entry, vaddr):\n"
+                         f"    return (entry & {frame_mask:#x}) | (vaddr & {offset_mask:#x})\n")
+            ns = {}
+            exec(code, ns)
+            self._translators = (ns["translate_4k"], ns["translate_2m"],
+                                 ns["translate_1g"])
+        return self._translators
+    
+    def _read_table(self, base):
+        """Read (or return the cached copy of) the 4KB page table at base."""
+        table = self._tables.get(base)
+        if table is None:
+            inferior = gdb.selected_inferior()
+            table = bytes(inferior.read_memory(base, 4096))
+            self._tables[base] = table
+        return table
+    
+    def _read_entry(self, base, index):
+        """Read entry index of the page table at base, a whole table at a time."""
+        try:
+            return _PTE_UNPACK(self._read_table(base), index * 8)[0]
+        except (gdb.error, RuntimeError, struct.error):
+            # Return 0 if memory cannot be read (e.g., invalid address)
+            return 0
+    
+    def invoke(self, arg, from_tty):
+        """Execute the neuro-pagetable-range command."""
+        argv = gdb.string_to_argv(arg)
+        if len(argv) != 2:
+            print("Usage: neuro-pagetable-range <start> <end>")
+            return
+        
+        try:
+            start, end = (int(a, 16) if a.startswith("0x") else int(a) for a in argv)
+            translate_4k, translate_2m, translate_1g = self._specialize()
+            read_entry = self._read_entry
+            phys_mask = self._PHYS_ADDR_MASK
+            
+            cr3 = int(gdb.parse_and_eval("$cr3"))
+            pml4_base = cr3 & ~0xFFF
+            
+            print(f"Mappings for 0x{start:016x} - 0x{end:016x}")
+            print("=" * 70)
+            print("VIRTUAL            PHYSICAL           SIZE  FLAGS")
+            print("-" * 70)
+            
+            vaddr = start & ~0xFFF
+            mapped = 0
+            while vaddr < end:
+                # Jump over the non-canonical hole to the kernel half
+                if self._HOLE_START <= vaddr < self._HIGH_HALF:
+                    vaddr = self._HIGH_HALF
+                    continue
+                
+                # Non-present upper levels skip everything they cover
+                pml4_entry = read_entry(pml4_base, (vaddr >> 39) & 0x1FF)
+                if not (pml4_entry & 1):
+                    vaddr = (vaddr | ((1 << 39) - 1)) + 1
+                    continue
+                
+                pdpt_entry = read_entry(pml4_entry & phys_mask, (vaddr >> 30) & 0x1FF)
+                if not (pdpt_entry & 1):
+                    vaddr = (vaddr | ((1 << 30) - 1)) + 1
+                    continue
+                
+                if pdpt_entry & (1 << 7):
+                    page = vaddr & ~((1 << 30) - 1)
+                    print(f"0x{page:016x} 0x{translate_1g(pdpt_entry, page):016x} 1GB   "
+                          f"{self._decode_flags(pdpt_entry)}")
+                    vaddr = page + (1 << 30)
+                    mapped += 1
+                    continue
+                
+                pd_entry = read_entry(pdpt_entry & phys_mask, (vaddr >> 21) & 0x1FF)
+                if not (pd_entry & 1):
+                    vaddr = (vaddr | 0x1FFFFF) + 1
+                    continue
+                
+                if pd_entry & (1 << 7):
+                    page = vaddr & ~0x1FFFFF
+                    print(f"0x{page:016x} 0x{translate_2m(pd_entry, page):016x} 2MB   "
+                          f"{self._decode_flags(pd_entry)}")
+                    vaddr = page + 0x200000
+                    mapped += 1
+                    continue
+                
+                pt_entry = read_entry(pd_entry & phys_mask, (vaddr >> 12) & 0x1FF)
+                if pt_entry & 1:
+                    print(f"0x{vaddr:016x} 0x{translate_4k(pt_entry, vaddr):016x} 4KB   "
+                          f"{self._decode_flags(pt_entry)}")
+                    mapped += 1
+                vaddr += 0x1000
+            
+            print(f"\nMapped pages: {mapped}")
+            
+        except Exception as e:
+            print(f"Error walking page table range: {e}")
+
 # Register all custom commands
 NeuroTasksCommand()
 NeuroMemoryCommand()
 NeuroBacktraceCommand()
 NeuroPageTableWalk()
+NeuroPageTableRange()
 
 print("Neuro-OS kernel debugging extensions loaded")
 print("Available commands:")
@@ -398,3 +760,4 @@ print("  neuro-tasks      - Display all tasks/processes")
 print("  neuro-memory     - Display memory statistics")
 print("  neuro-trace      - Enhanced backtrace")
 print("  neuro-pagetable  - Walk page table for an address")
+print("  neuro-pagetable-range - Dump mappings in an address range")